@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Protocol
 
+import numpy as np
+
 from evidec.decision.rule_utils import is_ratio_metric
 from evidec.experiment.result import StatResult
 from evidec.utils.formatting import _fmt_ci, _fmt_numeric, _fmt_p
 
 DecisionStatus = Literal["GO", "NO_GO", "INCONCLUSIVE"]
 
+# judge_batch の整数コード → ステータス文字列の対応表
+_STATUS_LABELS: tuple[DecisionStatus, ...] = ("GO", "NO_GO", "INCONCLUSIVE")
+
+# stats 辞書のキーをモジュール読み込み時に intern しておく。
+# 下流のキー照合がハッシュ再計算なしのポインタ比較で済む。
+_KEY_P_VALUE = sys.intern("p_value")
+_KEY_ALPHA = sys.intern("alpha")
+_KEY_EFFECT = sys.intern("effect")
+_KEY_MIN_LIFT = sys.intern("min_lift")
+_KEY_MARGIN = sys.intern("margin")
+_KEY_METHOD = sys.intern("method")
+_KEY_CI_LOW = sys.intern("ci_low")
+_KEY_CI_HIGH = sys.intern("ci_high")
+_KEY_MIN_EFFECT_SIZE = sys.intern("min_effect_size")
+
 __all__ = ["DecisionRule", "NonInferiorityRule", "Decision", "DecisionStatus", "RuleFormatter"]
 
 
@@ -21,14 +41,38 @@ class RuleFormatter(Protocol):
         """判定基準の説明文と主要な閾値（表示用文字列）を返す。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Decision:
     status: DecisionStatus
     reason: str
     stats: dict[str, float | str]
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=256)
+def _rule_constants(rule: DecisionRule) -> tuple[float, float, float, float | None]:
+    """ルール固定パラメータの部分評価結果をキャッシュする。
+
+    ルールは frozen dataclass で構築後に変化しないため、
+    metric_goal の検証と符号化・閾値の取り出しを 1 ルールにつき 1 回にする。
+    """
+
+    rule._validate_goal()
+    goal_sign = 1.0 if rule.metric_goal == "increase" else -1.0
+    return goal_sign, rule.alpha, rule.min_lift, rule.min_effect_size
+
+
+@lru_cache(maxsize=512)
+def _fmt_min_lift(min_lift: float, ratio_metric: bool) -> str:
+    """不変な min_lift の整形結果をキャッシュする。
+
+    同じルールを多数の結果に使い回すパイプラインでは
+    min_lift の整形文字列は毎回同一になるため、値×指標種別で 1 回だけ整形する。
+    """
+
+    return _fmt_numeric(min_lift, ratio_metric)
+
+
+@dataclass(frozen=True, slots=True)
 class DecisionRule:
     """実験結果の判定基準を定義するルール。
 
@@ -51,64 +95,120 @@ class DecisionRule:
         if self.metric_goal not in ("increase", "decrease"):
             raise ValueError("metric_goal は 'increase' か 'decrease' を指定してください")
 
+    def _evaluate(self, result: StatResult) -> tuple[DecisionStatus, str]:
+        """判定ステータスと理由種別を計算する（文字列整形なし）。
+
+        Returns:
+            (status, kind)。kind は理由文の種別
+            ("direction" | "go" | "not_significant" | "magnitude" | "effect_size")。
+        """
+
+        goal_sign, alpha, min_lift, min_effect_size = _rule_constants(self)
+
+        effect = result.effect
+        desired_effect = goal_sign * effect
+        if desired_effect < 0:
+            return "NO_GO", "direction"
+
+        significant = result.p_value <= alpha
+        magnitude_ok = desired_effect >= min_lift
+        effect_size_ok = (
+            True if min_effect_size is None else abs(effect) >= min_effect_size
+        )
+        if significant and magnitude_ok and effect_size_ok:
+            return "GO", "go"
+        if not significant:
+            return "INCONCLUSIVE", "not_significant"
+        if not magnitude_ok:
+            return "INCONCLUSIVE", "magnitude"
+        return "INCONCLUSIVE", "effect_size"
+
+    def judge_status(self, result: StatResult) -> DecisionStatus:
+        """判定ステータスのみを返す高速パス。
+
+        permutation テストやモンテカルロのように status だけ大量に必要な
+        呼び出し向け。理由文の整形や stats 辞書の構築を一切行わない。
+        """
+
+        return self._evaluate(result)[0]
+
+    def judge_batch(
+        self,
+        effects: Iterable[float],
+        p_values: Iterable[float],
+    ) -> list[DecisionStatus]:
+        """多数の結果をまとめて判定するベクトル化パス。
+
+        メトリクス×セグメントの一括評価のように judge_status を
+        Python ループで N 回呼ぶ代わりに、判定条件を NumPy の
+        ブールマスクとして一括計算する。理由文や stats 辞書は作らない。
+        """
+
+        goal_sign, alpha, min_lift, min_effect_size = _rule_constants(self)
+
+        effect_arr = np.asarray(effects, dtype=float)
+        p_arr = np.asarray(p_values, dtype=float)
+        if effect_arr.shape != p_arr.shape:
+            raise ValueError("effects と p_values は同じ長さにしてください")
+
+        desired = goal_sign * effect_arr
+        direction_ok = desired >= 0
+        go = direction_ok & (p_arr <= alpha) & (desired >= min_lift)
+        if min_effect_size is not None:
+            go &= np.abs(effect_arr) >= min_effect_size
+
+        # 0=GO, 1=NO_GO, 2=INCONCLUSIVE（_STATUS_LABELS に対応）
+        codes = np.select([go, ~direction_ok], [0, 1], default=2)
+        return [_STATUS_LABELS[code] for code in codes]
+
     def judge(self, result: StatResult) -> Decision:
         """統計結果に基づいてビジネス判断を下す。
 
         p値、有意性、最小リフト、目標方向を考慮して、
         実験結果の採用可否を判定する。
         """
-        self._validate_goal()
+        status, kind = self._evaluate(result)
         ratio_metric = is_ratio_metric(result)
 
         effect = result.effect
         ci_str = _fmt_ci(result.ci_low, result.ci_high, ratio_metric)
         p_str = _fmt_p(result.p_value)
         desired_effect = effect if self.metric_goal == "increase" else -effect
-        direction_ok = desired_effect >= 0
-        magnitude_ok = desired_effect >= self.min_lift
-        effect_size_ok = (
-            True if self.min_effect_size is None else abs(effect) >= self.min_effect_size
-        )
-        significant = result.p_value <= self.alpha
 
         lift_str = _fmt_numeric(desired_effect, ratio_metric)
-        min_lift_str = _fmt_numeric(self.min_lift, ratio_metric)
-        effect_str = _fmt_numeric(effect, ratio_metric)
+        min_lift_str = _fmt_min_lift(self.min_lift, ratio_metric)
         common_prefix = f"p={p_str}, CI={ci_str}, lift={lift_str}, min_lift={min_lift_str}"
 
-        if not direction_ok:
-            status: DecisionStatus = "NO_GO"
+        if kind == "direction":
+            # effect の整形はこの分岐でしか使わないためここで行う
+            effect_str = _fmt_numeric(effect, ratio_metric)
             reason = (
                 f"{common_prefix}, effect={effect_str} が目標方向("
                 f"metric_goal={self.metric_goal})と逆 → NO_GO"
             )
-        elif significant and magnitude_ok and effect_size_ok:
-            status = "GO"
+        elif kind == "go":
             reason = f"{common_prefix}, p ≤ α={self.alpha:.3f} かつ lift ≥ min_lift → GO"
-        elif not significant:
-            status = "INCONCLUSIVE"
+        elif kind == "not_significant":
             reason = f"{common_prefix}, p > α={self.alpha:.3f} → INCONCLUSIVE"
-        elif not magnitude_ok:
-            status = "INCONCLUSIVE"
+        elif kind == "magnitude":
             reason = f"{common_prefix}, p ≤ α={self.alpha:.3f} だが lift < min_lift → INCONCLUSIVE"
-        else:  # effect_size_ok is False
-            status = "INCONCLUSIVE"
+        else:  # kind == "effect_size"
             reason = (
                 f"{common_prefix}, |effect|={abs(effect):.4f} < "
                 f"min_effect_size={self.min_effect_size:.4f} → INCONCLUSIVE"
             )
 
         stats: dict[str, float | str] = {
-            "p_value": result.p_value,
-            "alpha": self.alpha,
-            "effect": result.effect,
-            "min_lift": self.min_lift,
-            "method": result.method,
-            "ci_low": result.ci_low,
-            "ci_high": result.ci_high,
+            _KEY_P_VALUE: result.p_value,
+            _KEY_ALPHA: self.alpha,
+            _KEY_EFFECT: result.effect,
+            _KEY_MIN_LIFT: self.min_lift,
+            _KEY_METHOD: result.method,
+            _KEY_CI_LOW: result.ci_low,
+            _KEY_CI_HIGH: result.ci_high,
         }
         if self.min_effect_size is not None:
-            stats["min_effect_size"] = self.min_effect_size
+            stats[_KEY_MIN_EFFECT_SIZE] = self.min_effect_size
 
         return Decision(status=status, reason=reason, stats=stats)
 
@@ -120,14 +220,14 @@ class DecisionRule:
             threshold_str: 表示に用いる主要な閾値文字列（min_lift を可視化）
         """
 
-        min_lift_str = _fmt_numeric(self.min_lift, ratio_metric)
+        min_lift_str = _fmt_min_lift(self.min_lift, ratio_metric)
         criterion_text = (
             f"α={self.alpha:.3f}, 最小リフト={min_lift_str}, 目標={self.metric_goal}"
         )
         return criterion_text, min_lift_str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NonInferiorityRule:
     """悪化していないことを確認するための非劣性判定ルール。
 
@@ -144,6 +244,27 @@ class NonInferiorityRule:
         if self.metric_goal not in ("increase", "decrease"):
             raise ValueError("metric_goal は 'increase' か 'decrease' を指定してください")
 
+    def _evaluate(self, result: StatResult) -> DecisionStatus:
+        """判定ステータスを計算する（文字列整形なし）。"""
+
+        self._validate_goal()
+        ci_low, ci_high = result.ci_low, result.ci_high
+
+        # 判定ロジック（有害方向に対する許容幅で判断）
+        if self.metric_goal == "increase":
+            if ci_low >= -self.margin:
+                return "GO"
+            return "NO_GO" if ci_high < -self.margin else "INCONCLUSIVE"
+        # decrease が目標 → 有害方向は正の差分
+        if ci_high <= self.margin:
+            return "GO"
+        return "NO_GO" if ci_low > self.margin else "INCONCLUSIVE"
+
+    def judge_status(self, result: StatResult) -> DecisionStatus:
+        """判定ステータスのみを返す高速パス（理由文の整形なし）。"""
+
+        return self._evaluate(result)
+
     def judge(self, result: StatResult) -> Decision:
         """非劣性 (悪化していないこと) を判定する。
 
@@ -153,24 +274,15 @@ class NonInferiorityRule:
           CI下限が margin を超えれば NO_GO、それ以外は INCONCLUSIVE。
         """
 
-        self._validate_goal()
+        status = self._evaluate(result)
         ratio_metric = is_ratio_metric(result)
 
         ci_low, ci_high = result.ci_low, result.ci_high
 
-        # 判定ロジック（有害方向に対する許容幅で判断）
-        if self.metric_goal == "increase":
-            go = ci_low >= -self.margin
-            nogo = ci_high < -self.margin
-        else:  # decrease が目標 → 有害方向は正の差分
-            go = ci_high <= self.margin
-            nogo = ci_low > self.margin
-
         margin_str = _fmt_numeric(self.margin, ratio_metric, force_sign=False)
         ci_str = _fmt_ci(ci_low, ci_high, ratio_metric)
 
-        if go:
-            status: DecisionStatus = "GO"
+        if status == "GO":
             if self.metric_goal == "increase":
                 reason_detail = (
                     f"CI下限={_fmt_numeric(ci_low, ratio_metric)} ≥ -{margin_str}"
@@ -180,8 +292,7 @@ class NonInferiorityRule:
                     f"CI上限={_fmt_numeric(ci_high, ratio_metric)} ≤ +{margin_str}"
                 )
             reason = f"非劣性クリア: {reason_detail} → 悪化なしと判断"
-        elif nogo:
-            status = "NO_GO"
+        elif status == "NO_GO":
             if self.metric_goal == "increase":
                 reason_detail = (
                     f"CI上限={_fmt_numeric(ci_high, ratio_metric)} < -{margin_str}"
@@ -192,7 +303,6 @@ class NonInferiorityRule:
                 )
             reason = f"悪化懸念: {reason_detail}"
         else:
-            status = "INCONCLUSIVE"
             limit_str = f"-{margin_str}" if self.metric_goal == "increase" else f"+{margin_str}"
             reason = (
                 "判断保留: CIが許容悪化幅をまたぐ "
@@ -200,13 +310,13 @@ class NonInferiorityRule:
             )
 
         stats: dict[str, float | str] = {
-            "p_value": result.p_value,
-            "alpha": self.alpha,
-            "effect": result.effect,
-            "margin": self.margin,
-            "method": result.method,
-            "ci_low": result.ci_low,
-            "ci_high": result.ci_high,
+            _KEY_P_VALUE: result.p_value,
+            _KEY_ALPHA: self.alpha,
+            _KEY_EFFECT: result.effect,
+            _KEY_MARGIN: self.margin,
+            _KEY_METHOD: result.method,
+            _KEY_CI_LOW: result.ci_low,
+            _KEY_CI_HIGH: result.ci_high,
         }
 
         return Decision(status=status, reason=reason, stats=stats)
@@ -5,8 +5,9 @@ report/decision で共有する軽量ロジックを集約する。
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Literal, Protocol
+from collections.abc import Callable, Hashable
+from functools import lru_cache
+from typing import Literal, Protocol, cast
 
 from evidec.experiment.result import StatResult
 from evidec.utils.formatting import _fmt_numeric
@@ -22,22 +23,43 @@ class RuleDisplayContext(Protocol):
     min_lift: float
 
 
+@lru_cache(maxsize=1024)
 def is_ratio_metric(stat_result: StatResult) -> bool:
-    """比率指標かどうかを判定する。"""
+    """比率指標かどうかを判定する。
+
+    StatResult は frozen dataclass でハッシュ可能なため、
+    judge / レポート生成で繰り返し呼ばれる判定を lru_cache で共有する。
+    """
 
     return stat_result.baseline is not None and 0 <= stat_result.baseline <= 1
 
 
+@lru_cache(maxsize=256)
+def _cached_describe_threshold(rule: Hashable, ratio_metric: bool) -> tuple[str, str]:
+    """describe_threshold の結果をルール単位でキャッシュする。
+
+    lru_cache のキーにするため引数は Hashable で受け、呼び出し側で
+    describe_threshold を持つルールだけを渡す。
+    """
+
+    result = rule.describe_threshold(ratio_metric)  # type: ignore[attr-defined]
+    return cast("tuple[str, str]", result)
+
+
 def describe_rule_threshold(rule: RuleDisplayContext, ratio_metric: bool) -> tuple[str, str]:
     """判定ルールの閾値を表示用に整形する。
 
     describe_threshold が実装されていればそれを利用し、
     未実装の場合は min_lift を使ったデフォルト表記を返す。
+    ルールが frozen dataclass（ハッシュ可能）の場合は結果をキャッシュする。
     """
 
     describe: Callable[[bool], tuple[str, str]] | None = getattr(rule, "describe_threshold", None)
     if callable(describe):
-        return describe(ratio_metric)
+        try:
+            return _cached_describe_threshold(cast("Hashable", rule), ratio_metric)
+        except TypeError:  # ハッシュ不可能なルールはキャッシュせず直接呼ぶ
+            return describe(ratio_metric)
 
     min_lift_str = _fmt_numeric(rule.min_lift, ratio_metric)
     criterion_text = f"α={rule.alpha:.3f}, 最小リフト={min_lift_str}, 目標={rule.metric_goal}"
@@ -10,14 +10,14 @@ import numpy as np
 from numpy.typing import NDArray
 
 from evidec.experiment.result import StatResult
-from evidec.stats import ttest_means, ztest_proportions
+from evidec.stats import ttest_means_from_stats, ztest_proportions
 
 NDArrayFloat: TypeAlias = NDArray[np.float64]
 
 __all__ = ["Experiment"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Experiment:
     """A/Bテストの実験設定と実行を管理するクラス。
 
@@ -44,30 +44,58 @@ class Experiment:
 
     def _to_array(self, data: Iterable[float] | NDArrayFloat) -> NDArrayFloat:
         arr: NDArrayFloat = np.asarray(data, dtype=float)
+        if arr.size == 0:
+            raise ValueError("NaN を除去した結果、入力データが空です")
+        # NaN なしの一般的なケースではマスク確保もコピーも行わない。
+        # min() は NaN を伝播するため、1 パスの集約で NaN 有無を検出できる
+        if not np.isnan(arr.min()):
+            return arr
         arr = arr[~np.isnan(arr)]
         if arr.size == 0:
             raise ValueError("NaN を除去した結果、入力データが空です")
         return arr
 
+    def _to_finite_array(self, arr: NDArrayFloat, role: str) -> NDArrayFloat:
+        """t検定用に無限大も除去し、最小サンプル数を確認する。"""
+
+        finite = arr[np.isfinite(arr)]
+        if finite.size < 2:
+            raise ValueError(
+                f"{role}: NaN と無限大を除去した後も各サンプルに 2 件以上のデータが必要です"
+            )
+        return finite
+
     def _is_binary_array(self, arr: NDArrayFloat) -> bool:
-        unique = np.unique(arr)
-        return bool(np.all((unique == 0) | (unique == 1)))
+        # np.unique の全体ソートを避け、min/max の範囲チェックで早期に判定する
+        mn, mx = float(arr.min()), float(arr.max())
+        if mn < 0 or mx > 1:
+            return False
+        if (mn == 0 or mn == 1) and (mx == 0 or mx == 1):
+            # 端点がともに 0/1 でも中間値 (例: 0.5) があり得るため等値判定は必要
+            return bool(np.all((arr == 0) | (arr == 1)))
+        return False
 
     def _resolve_kind(
         self, control_data: object, treatment_data: object
-    ) -> Literal["proportion", "mean"]:
+    ) -> tuple[Literal["proportion", "mean"], NDArrayFloat | None, NDArrayFloat | None]:
+        """検定種別を解決する。
+
+        配列入力の場合はクリーニング済み配列も返し、
+        fit 側での再変換・再走査を避ける。
+        """
+
         control_is_count = self._is_count_tuple(control_data)
         treatment_is_count = self._is_count_tuple(treatment_data)
         if control_is_count or treatment_is_count:
             if not (control_is_count and treatment_is_count):
                 raise ValueError("対照・処理の両方で (成功数, 総数) を指定してください")
-            return "proportion"
+            return "proportion", None, None
 
         control_arr = self._to_array(control_data)  # type: ignore[arg-type]
         treatment_arr = self._to_array(treatment_data)  # type: ignore[arg-type]
         if self._is_binary_array(control_arr) and self._is_binary_array(treatment_arr):
-            return "proportion"
-        return "mean"
+            return "proportion", control_arr, treatment_arr
+        return "mean", control_arr, treatment_arr
 
     def fit(self, control_data: object, treatment_data: object) -> StatResult:
         """適切な統計検定を実行し、結果をStatResultとして返す。
@@ -80,26 +108,39 @@ class Experiment:
         if len(self.variant_names) != 2:
             raise ValueError("variant_names は2要素を含む必要があります")
 
-        kind = self._resolve_kind(control_data, treatment_data)
+        kind, control_arr, treatment_arr = self._resolve_kind(control_data, treatment_data)
 
         if kind == "proportion":
-            control_input = cast(Iterable[float] | tuple[int, int], control_data)
-            treatment_input = cast(Iterable[float] | tuple[int, int], treatment_data)
-            effect, p_value, ci_low, ci_high = ztest_proportions(
-                control_input, None, treatment_input, None
-            )
-            if self._is_count_tuple(control_data):
+            if control_arr is None or treatment_arr is None:
                 control_success, control_total = cast(tuple[int, int], control_data)
-                baseline = control_success / control_total
+                treatment_pair = cast(tuple[int, int], treatment_data)
             else:
-                control_arr = self._to_array(cast(Iterable[float], control_data))
-                baseline = float(control_arr.mean())
+                # クリーニング済み 0/1 配列から (成功数, 総数) を一度だけ集計する
+                control_success = int(np.count_nonzero(control_arr))
+                control_total = int(control_arr.size)
+                treatment_pair = (
+                    int(np.count_nonzero(treatment_arr)),
+                    int(treatment_arr.size),
+                )
+            effect, p_value, ci_low, ci_high = ztest_proportions(
+                (control_success, control_total), None, treatment_pair, None
+            )
+            baseline = control_success / control_total
             method: Literal["two-proportion z-test", "two-sample t-test"] = "two-proportion z-test"
         else:
-            control_arr = self._to_array(cast(Iterable[float], control_data))
-            treatment_arr = self._to_array(cast(Iterable[float], treatment_data))
-            effect, p_value, ci_low, ci_high = ttest_means(control_arr, treatment_arr)
-            baseline = float(control_arr.mean())
+            assert control_arr is not None and treatment_arr is not None
+            control_arr = self._to_finite_array(control_arr, "control")
+            treatment_arr = self._to_finite_array(treatment_arr, "treatment")
+            control_mean = float(control_arr.mean())
+            effect, p_value, ci_low, ci_high = ttest_means_from_stats(
+                control_arr.size,
+                control_mean,
+                float(control_arr.var(ddof=1)),
+                treatment_arr.size,
+                float(treatment_arr.mean()),
+                float(treatment_arr.var(ddof=1)),
+            )
+            baseline = control_mean
             method = "two-sample t-test"
 
         result = StatResult(
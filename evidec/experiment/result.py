@@ -8,7 +8,7 @@ from typing import Literal
 __all__ = ["StatResult"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StatResult:
     effect: float
     p_value: float
@@ -12,16 +12,67 @@ if TYPE_CHECKING:  # pragma: no cover
     from evidec.experiment.experiment import Experiment
     from evidec.experiment.result import StatResult
 
+# 判定ステータス → (アイコン, 高確度時アクション, 通常時アクション) の固定テーブル
+_STATUS_META: dict[str, tuple[str, str, str]] = {
+    "GO": (
+        "✅",
+        "全面ロールアウトを推奨（確度高）",
+        "段階的ロールアウトを推奨（モニタリング継続）",
+    ),
+    "NO_GO": (
+        "❌",
+        "ロールアウト非推奨（現状維持または改善へ）",
+        "ロールアウト非推奨（現状維持または改善へ）",
+    ),
+    "INCONCLUSIVE": (
+        "⚠️",
+        "判断保留（追加データ収集またはテスト延長）",
+        "判断保留（追加データ収集またはテスト延長）",
+    ),
+}
+
+# 行リストの構築と join を避け、1 回の format_map でレポート全体を組み立てるテンプレート
+_REPORT_TEMPLATE = """\
+# エビデンスレポート: {name}
+
+## 結論
+- **判定**: {status_emoji} **{status}**
+- **推奨アクション**: {action_recommendation}
+- **理由**: {reason}
+
+## 主要結果
+- **指標**: {metric}
+- **変化量 (絶対)**: {abs_lift_pp_str}
+- **変化率 (相対)**: {lift_ratio_str}
+- **{ci_label}**: [{ci_low_str}, {ci_high_str}]
+- **確信度 (参考)**: p={p_str}
+
+## 実験詳細
+- **群構成**: {base_name} (Base) vs {test_name} (Test)
+- **ベースライン値**: {baseline_str}
+- **検定手法**: {method}
+- **判定基準**: {criterion_text}
+
+> **注記**
+> - 信頼区間が0を含まない場合、効果の方向性は確実です。
+> - p値は「差が偶然生じる確率」を表します。基準値(α)より小さい場合に有意とみなします。"""
+
 
 def render_markdown(
-    experiment: Experiment, decision: Decision, stat_result: StatResult, rule: RuleDisplayContext
+    experiment: Experiment,
+    decision: Decision,
+    stat_result: StatResult,
+    rule: RuleDisplayContext,
+    *,
+    ratio_metric: bool | None = None,
 ) -> str:
     """実験結果を構造化されたMarkdownレポートに整形する。
 
     意思決定に必要な情報を「結論」「主要結果」「詳細」の順に整理し、
     シンプルで読みやすい形式で出力する。
+    呼び出し側が指標種別を判定済みの場合は ratio_metric で渡せる。
     """
-    ratio = is_ratio_metric(stat_result)
+    ratio = is_ratio_metric(stat_result) if ratio_metric is None else ratio_metric
 
     effect_str = _fmt_numeric(stat_result.effect, ratio)
     # 信頼区間は比率指標の場合、ppで表示
@@ -50,53 +101,31 @@ def render_markdown(
         lift_ratio = stat_result.effect / stat_result.baseline
         lift_ratio_str = _fmt_numeric(lift_ratio, True)
 
-    # 判定ステータスとアイコン
-    status_emoji = {
-        "GO": "✅",
-        "NO_GO": "❌",
-        "INCONCLUSIVE": "⚠️",
-    }.get(decision.status, "")
-
-    # 推奨アクション
-    action_recommendation = ""
-    if decision.status == "GO":
-        if stat_result.p_value < 0.001:
-            action_recommendation = "全面ロールアウトを推奨（確度高）"
-        else:
-            action_recommendation = "段階的ロールアウトを推奨（モニタリング継続）"
-    elif decision.status == "NO_GO":
-        action_recommendation = "ロールアウト非推奨（現状維持または改善へ）"
-    else:
-        action_recommendation = "判断保留（追加データ収集またはテスト延長）"
-
-    lines = [
-        f"# エビデンスレポート: {experiment.name}",
-        "",
-        "## 結論",
-        f"- **判定**: {status_emoji} **{decision.status}**",
-        f"- **推奨アクション**: {action_recommendation}",
-        f"- **理由**: {decision.reason}",
-        "",
-        "## 主要結果",
-        f"- **指標**: {experiment.metric}",
-        f"- **変化量 (絶対)**: {abs_lift_pp_str}",
-        f"- **変化率 (相対)**: {lift_ratio_str}",
-        f"- **{ci_label}**: [{ci_low_str}, {ci_high_str}]",
-        f"- **確信度 (参考)**: p={p_str}",
-        "",
-        "## 実験詳細",
-        f"- **群構成**: {experiment.variant_names[0]} (Base) "
-        f"vs {experiment.variant_names[1]} (Test)",
-        f"- **ベースライン値**: {baseline_str}",
-        f"- **検定手法**: {stat_result.method}",
-        f"- **判定基準**: {criterion_text}",
-        "",
-        "> **注記**",
-        "> - 信頼区間が0を含まない場合、効果の方向性は確実です。",
-        "> - p値は「差が偶然生じる確率」を表します。基準値(α)より小さい場合に有意とみなします。",
-    ]
-
-    return "\n".join(lines)
+    # 判定ステータスごとのアイコンと推奨アクション（1 回の辞書参照で取得）
+    status_emoji, action_high, action_normal = _STATUS_META.get(decision.status, ("", "", ""))
+    action_recommendation = action_high if stat_result.p_value < 0.001 else action_normal
+
+    return _REPORT_TEMPLATE.format_map(
+        {
+            "name": experiment.name,
+            "status_emoji": status_emoji,
+            "status": decision.status,
+            "action_recommendation": action_recommendation,
+            "reason": decision.reason,
+            "metric": experiment.metric,
+            "abs_lift_pp_str": abs_lift_pp_str,
+            "lift_ratio_str": lift_ratio_str,
+            "ci_label": ci_label,
+            "ci_low_str": ci_low_str,
+            "ci_high_str": ci_high_str,
+            "p_str": p_str,
+            "base_name": experiment.variant_names[0],
+            "test_name": experiment.variant_names[1],
+            "baseline_str": baseline_str,
+            "method": stat_result.method,
+            "criterion_text": criterion_text,
+        }
+    )
 
 
 __all__ = ["render_markdown"]
@@ -17,7 +17,7 @@ if TYPE_CHECKING:  # pragma: no cover
 __all__ = ["EvidenceReport"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceReport:
     """実験結果の証拠レポート。
 
@@ -64,7 +64,7 @@ class EvidenceReport:
         decision_rule, _ = describe_rule_threshold(rule, ratio)
 
         interpretation = decision.reason
-        markdown = render_markdown(experiment, decision, stat_result, rule)
+        markdown = render_markdown(experiment, decision, stat_result, rule, ratio_metric=ratio)
         return cls(
             summary=summary,
             statistical_evidence=statistical,
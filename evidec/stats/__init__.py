@@ -1,6 +1,28 @@
 """evidec で利用する統計検定実装モジュール。"""
 
-from evidec.stats.ttest import ttest_means
-from evidec.stats.ztest import ztest_proportions
+from evidec.stats.bayes import (
+    BayesParams,
+    BayesResult,
+    BetaBinomialSession,
+    fit_beta_binomial,
+    fit_beta_binomial_batch,
+    fit_beta_binomial_from_arrays,
+    fit_beta_binomial_from_prior,
+)
+from evidec.stats.ttest import ttest_means, ttest_means_batch, ttest_means_from_stats
+from evidec.stats.ztest import ztest_proportions, ztest_proportions_batch
 
-__all__ = ["ztest_proportions", "ttest_means"]
+__all__ = [
+    "ztest_proportions",
+    "ztest_proportions_batch",
+    "ttest_means",
+    "ttest_means_batch",
+    "ttest_means_from_stats",
+    "BayesParams",
+    "BayesResult",
+    "BetaBinomialSession",
+    "fit_beta_binomial",
+    "fit_beta_binomial_batch",
+    "fit_beta_binomial_from_arrays",
+    "fit_beta_binomial_from_prior",
+]
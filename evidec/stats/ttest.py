@@ -7,11 +7,13 @@ Welch t-test をデフォルトにし、等分散仮定は `equal_var=True` で
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
+from math import sqrt
 from typing import TypeAlias
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy import stats
+from scipy import special
 
 NDArrayFloat: TypeAlias = NDArray[np.float64]
 
@@ -25,8 +27,11 @@ def _preprocess(data: Iterable[float] | NDArrayFloat, *, role: str = "input") ->
     3. サンプルサイズ要件の確認 (n >= 2)
     """
     array: NDArrayFloat = np.asarray(data, dtype=float)
-    # NaNと無限大を除去
-    array = array[~np.isnan(array) & ~np.isinf(array)]
+    # NaNと無限大を除去（isnan/isinf の 2 マスクではなく isfinite の 1 パス）。
+    # 不正値がない場合（典型ケース）はマスクコピーを作らずそのまま返す。
+    finite = np.isfinite(array)
+    if not finite.all():
+        array = array[finite]
 
     if array.size < 2:
         raise ValueError(
@@ -53,34 +58,41 @@ def _ensure_nonzero_standard_error(se: float) -> None:
         raise ValueError("標準誤差が 0 です。入力にばらつきがありません")  # pragma: no cover
 
 
-def _compute_basic_stats(
-    control: NDArrayFloat, treatment: NDArrayFloat
-) -> tuple[int, int, float, float, float]:
-    """サンプル数・分散・効果量など基本統計量を計算する。"""
-    n1, n2 = control.size, treatment.size
-    effect = float(treatment.mean() - control.mean())
-    var1 = float(control.var(ddof=1))
-    var2 = float(treatment.var(ddof=1))
-    return n1, n2, var1, var2, effect
-
-
 def _compute_standard_error(
     var1: float, var2: float, n1: int, n2: int, equal_var: bool
 ) -> tuple[float, float]:
-    """標準誤差と自由度を計算する。"""
+    """標準誤差と自由度を計算する。
+
+    スカラー入力なので ufunc ディスパッチを伴う np.sqrt ではなく math.sqrt を使う。
+    """
     if equal_var:
         df = float(n1 + n2 - 2)
         pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / df
-        se = np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+        se = sqrt(pooled_var * (1 / n1 + 1 / n2))
     else:
         df = _welch_df(var1, var2, n1, n2)
-        se = np.sqrt(var1 / n1 + var2 / n2)
+        se = sqrt(var1 / n1 + var2 / n2)
     return df, se
 
 
+@lru_cache(maxsize=1024)
+def _t_crit_975(df: float) -> float:
+    """自由度ごとの 97.5% 分位点をキャッシュする。
+
+    固定デザインの A/B テストでは同じサンプルサイズ（= 同じ自由度）が
+    繰り返し現れるため、自由度そのものをキーにして分位点計算を省く。
+    丸めはしない（小標本では t_crit が自由度に敏感なため）。
+    """
+    return float(special.stdtrit(df, 0.975))
+
+
 def _compute_confidence_interval(effect: float, se: float, df: float) -> tuple[float, float]:
-    """95%信頼区間を計算する。"""
-    t_crit = stats.t.ppf(0.975, df)
+    """95%信頼区間を計算する。
+
+    rv_continuous のディスパッチを通る stats.t.ppf ではなく、
+    C 実装を直接呼ぶ scipy.special.stdtrit を使う。
+    """
+    t_crit = _t_crit_975(df)
     ci_low = effect - t_crit * se
     ci_high = effect + t_crit * se
     return float(ci_low), float(ci_high)
@@ -104,19 +116,67 @@ def _prepare_samples(
     return control, treatment
 
 
+def _moments(array: NDArrayFloat) -> tuple[int, float, float]:
+    """サンプル数・平均・不偏分散を残差の自己内積（BLAS ddot）で計算する。
+
+    E[x²] − E[x]² 形の 1 パス式は平均が大きいデータで桁落ちして
+    分散を大きく狂わせるため、平均を引いた残差の 2 乗和から求める。
+    var(ddof=1) と同じ 2 パス構成で、数値的にも一致する。
+    入力は前処理済みで有限値のみであることを前提とする。
+    """
+
+    n = array.size
+    mean = float(array.sum()) / n
+    resid = array - mean
+    var = float(resid.dot(resid)) / (n - 1)
+    return n, mean, var
+
+
 def _run_ttest(
     control: NDArrayFloat, treatment: NDArrayFloat, equal_var: bool
 ) -> tuple[float, float, float, float]:
     """t検定の主要ロジックをまとめたヘルパー。"""
 
-    n1, n2, var1, var2, effect = _compute_basic_stats(control, treatment)
-    _validate_assumptions(var1, var2)
+    n1, mean1, var1 = _moments(control)
+    n2, mean2, var2 = _moments(treatment)
+    return ttest_means_from_stats(n1, mean1, var1, n2, mean2, var2, equal_var=equal_var)
+
+
+def ttest_means_from_stats(
+    control_n: int,
+    control_mean: float,
+    control_var: float,
+    treatment_n: int,
+    treatment_mean: float,
+    treatment_var: float,
+    *,
+    equal_var: bool = False,
+) -> tuple[float, float, float, float]:
+    """十分統計量（サンプル数・平均・不偏分散）から二群の平均差を検定する。
+
+    呼び出し側が既にクリーニング済みの配列から統計量を計算している場合、
+    生配列を渡して再度の前処理・再走査を行うより効率的。
+    結果は ttest_means と同一。
 
-    _, p_value = stats.ttest_ind(treatment, control, equal_var=equal_var)
+    Returns:
+        (effect, p_value, ci_low, ci_high) のタプル
+        effect = treatment_mean - control_mean
+    """
 
-    df, se = _compute_standard_error(var1, var2, n1, n2, equal_var)
+    if control_n < 2 or treatment_n < 2:
+        raise ValueError("各サンプルに 2 件以上のデータが必要です")
+
+    effect = treatment_mean - control_mean
+    _validate_assumptions(control_var, treatment_var)
+
+    df, se = _compute_standard_error(
+        control_var, treatment_var, control_n, treatment_n, equal_var
+    )
     _ensure_nonzero_standard_error(se)
 
+    # stdtr は t 分布の CDF（C 実装への直接呼び出し）
+    t_stat = effect / se
+    p_value = 2 * float(special.stdtr(df, -abs(t_stat)))
     ci_low, ci_high = _compute_confidence_interval(effect, se, df)
     return float(effect), float(p_value), float(ci_low), float(ci_high)
 
@@ -140,4 +200,76 @@ def ttest_means(
     return _run_ttest(control, treatment, equal_var)
 
 
-__all__ = ["ttest_means"]
+def _row_moments(
+    matrix: NDArrayFloat, role: str
+) -> tuple[NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+    """行列の行ごとにサンプル数・平均・不偏分散を計算する。
+
+    NaN・無限大は行ごとに無視する（_preprocess の除去処理の行列版）。
+    """
+
+    finite = np.isfinite(matrix)
+    n = finite.sum(axis=1).astype(float)
+    if np.any(n < 2):
+        raise ValueError(
+            f"{role}: NaN と無限大を除去した後も各サンプルに 2 件以上のデータが必要です"
+        )
+    filled = np.where(finite, matrix, 0.0)
+    mean = filled.sum(axis=1) / n
+    # _moments と同じく残差 2 乗和で計算する（E[x²]−E[x]² 形は桁落ちする）
+    resid = np.where(finite, matrix - mean[:, None], 0.0)
+    var = np.einsum("ij,ij->i", resid, resid) / (n - 1)
+    return n, mean, var
+
+
+def ttest_means_batch(
+    control_matrix: NDArrayFloat,
+    treatment_matrix: NDArrayFloat,
+    *,
+    equal_var: bool = False,
+) -> tuple[NDArrayFloat, NDArrayFloat, NDArrayFloat, NDArrayFloat]:
+    """K 本の二群 t 検定を一括実行する。
+
+    メトリクス×セグメントのように多数のペアを評価する場合、
+    ttest_means を Python ループで回す代わりに行列の axis 縮約と
+    配列版 stdtr / stdtrit で K 本をまとめて計算する。
+    行内の NaN・無限大は無視される（可変長サンプルは NaN パディングで表現）。
+
+    Args:
+        control_matrix: 形状 (K, n_control) の対照群データ
+        treatment_matrix: 形状 (K, n_treatment) の実験群データ
+
+    Returns:
+        (effects, p_values, ci_lows, ci_highs) — いずれも形状 (K,) の配列
+    """
+
+    control = np.asarray(control_matrix, dtype=float)
+    treatment = np.asarray(treatment_matrix, dtype=float)
+    if control.ndim != 2 or treatment.ndim != 2 or control.shape[0] != treatment.shape[0]:
+        raise ValueError("control と treatment は同じ行数の 2 次元配列にしてください")
+
+    n1, mean1, var1 = _row_moments(control, "control")
+    n2, mean2, var2 = _row_moments(treatment, "treatment")
+
+    if np.any((var1 == 0) & (var2 == 0)):
+        raise ValueError("標準誤差が 0 です。入力にばらつきがありません")
+
+    effect = mean2 - mean1
+    if equal_var:
+        df = n1 + n2 - 2
+        pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / df
+        se = np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+    else:
+        num = (var1 / n1 + var2 / n2) ** 2
+        denom = ((var1 / n1) ** 2) / (n1 - 1) + ((var2 / n2) ** 2) / (n2 - 1)
+        df = num / denom
+        se = np.sqrt(var1 / n1 + var2 / n2)
+
+    t_stat = effect / se
+    p_value = 2 * special.stdtr(df, -np.abs(t_stat))
+    t_crit = special.stdtrit(df, 0.975)
+    margin = t_crit * se
+    return effect, p_value, effect - margin, effect + margin
+
+
+__all__ = ["ttest_means", "ttest_means_batch", "ttest_means_from_stats"]
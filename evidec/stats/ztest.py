@@ -12,7 +12,10 @@ from collections.abc import Iterable
 from typing import cast, overload
 
 import numpy as np
-from scipy import stats
+from scipy.special import log_ndtr, ndtri
+
+# 95%信頼区間用の臨界値はモジュール読み込み時に 1 回だけ計算する
+_Z_CRIT_975 = float(ndtri(0.975))
 
 
 def _is_sequence_of_length_two(data: object) -> bool:
@@ -46,19 +49,39 @@ def _preprocess(data: Iterable[float] | tuple[int, int]) -> tuple[int, int]:
     array = np.asarray(data)
     if array.ndim == 0:
         raise ValueError("比率データには配列/シーケンスを指定してください")
-    array = array[~np.isnan(array.astype(float))]  # drop NaN if any
-    if array.size == 0:
-        raise ValueError("NaN を除去した結果、配列が空になりました")
-
     if not np.issubdtype(array.dtype, np.number) and array.dtype != bool:
         raise ValueError("比率データは数値または bool である必要があります")
 
-    unique_values = np.unique(array)
-    if np.any((unique_values != 0) & (unique_values != 1)):
-        raise ValueError("比率データの配列は 0/1 のみを含む必要があります")
+    # dtype ごとに最小限のパスで検証・集計する（unique のソートや float コピーは不要）
+    if array.dtype == bool:
+        # bool は NaN も 0/1 逸脱もあり得ない
+        if array.size == 0:
+            raise ValueError("NaN を除去した結果、配列が空になりました")
+        return int(np.count_nonzero(array)), int(array.size)
+
+    if np.issubdtype(array.dtype, np.integer):
+        # 整数は NaN があり得ないため範囲チェックのみ（min/max は単一パスの縮約）
+        if array.size == 0:
+            raise ValueError("NaN を除去した結果、配列が空になりました")
+        if array.min() < 0 or array.max() > 1:
+            raise ValueError("比率データの配列は 0/1 のみを含む必要があります")
+        return int(array.sum()), int(array.size)
+
+    # float 系: NaN の有無は min への NaN 伝播で判定（マスク割り当てなし）
+    nan_count = 0
+    if array.size and np.isnan(array.min()):
+        # フィルタ済みコピーは作らず、カウントだけで NaN を除外する
+        nan_count = int(np.count_nonzero(np.isnan(array)))
+    total_count = int(array.size) - nan_count
+    if total_count == 0:
+        raise ValueError("NaN を除去した結果、配列が空になりました")
 
-    success_count = int(array.sum())
-    total_count = int(array.size)
+    # 非ゼロ数と 1 の個数が一致すれば値は 0/1 のみ（検証と成功数カウントを融合）。
+    # count_nonzero は NaN を非ゼロ扱いするため NaN の個数を差し引く。
+    nonzero_count = int(np.count_nonzero(array)) - nan_count
+    success_count = int(np.count_nonzero(array == 1))
+    if nonzero_count != success_count:
+        raise ValueError("比率データの配列は 0/1 のみを含む必要があります")
     return success_count, total_count
 
 
@@ -85,8 +108,14 @@ def _ensure_nonzero_standard_error(se: float) -> None:
 def _compute_pooled_variance(
     c_success: int, c_total: int, t_success: int, t_total: int
 ) -> float:
-    """プールした分散を計算する。"""
-    pooled = (c_success + t_success) / (c_total + t_total)
+    """プールした分散を計算する。
+
+    _preprocess が組み込み int を返すため、和は Python の多倍長整数として
+    正確に計算され、float への丸めは最後の除算の 1 回だけになる。
+    """
+    numerator = c_success + t_success
+    denominator = c_total + t_total
+    pooled = numerator / denominator
     return pooled * (1 - pooled) * (1 / c_total + 1 / t_total)
 
 
@@ -97,7 +126,8 @@ def _compute_basic_stats(
     control_rate = c_success / c_total
     treatment_rate = t_success / t_total
     effect = treatment_rate - control_rate
-    se_diff = np.sqrt(
+    # スカラー演算なので ufunc ディスパッチを伴う np.sqrt ではなく math.sqrt を使う
+    se_diff = math.sqrt(
         control_rate * (1 - control_rate) / c_total
         + treatment_rate * (1 - treatment_rate) / t_total
     )
@@ -105,16 +135,18 @@ def _compute_basic_stats(
 
 
 def _compute_confidence_interval(effect: float, se_diff: float) -> tuple[float, float]:
-    """95%信頼区間を計算する。"""
-    z_crit = stats.norm.ppf(0.975)
-    ci_low = effect - z_crit * se_diff
-    ci_high = effect + z_crit * se_diff
+    """95%信頼区間を計算する。
+
+    臨界値は定数なのでモジュール定数 _Z_CRIT_975 を参照する。
+    """
+    ci_low = effect - _Z_CRIT_975 * se_diff
+    ci_high = effect + _Z_CRIT_975 * se_diff
     return float(ci_low), float(ci_high)
 
 
 def _apply_agresti_caffo_correction(
     c_success: int, c_total: int, t_success: int, t_total: int
-) -> tuple[int, int, int, int]:
+) -> tuple[int, int, int, int, bool]:
     """小標本に対してAgresti-Caffo補正を適用する。
 
     小標本の判定基準:
@@ -122,13 +154,25 @@ def _apply_agresti_caffo_correction(
     - 最小セル数 < 5
 
     補正内容: 各群に成功1・失敗1を加算
+
+    Returns:
+        補正後のカウント 4 つと、補正を適用したかどうかのフラグ。
+        フラグが False のとき呼び出し側は補正前の統計量を再利用できる。
     """
-    min_cells = min(c_success, t_success, c_total - c_success, t_total - t_success)
-    small_sample = min(c_total, t_total) < 30 or min_cells < 5
+    # 可変長引数の min() はタプル構築と走査を伴うため、二項比較で最小セル数を求める
+    failures_c = c_total - c_success
+    failures_t = t_total - t_success
+    min_cells = c_success if c_success < t_success else t_success
+    if failures_c < min_cells:
+        min_cells = failures_c
+    if failures_t < min_cells:
+        min_cells = failures_t
+    min_total = c_total if c_total < t_total else t_total
+    small_sample = min_total < 30 or min_cells < 5
 
     if small_sample:
-        return c_success + 1, c_total + 2, t_success + 1, t_total + 2
-    return c_success, c_total, t_success, t_total
+        return c_success + 1, c_total + 2, t_success + 1, t_total + 2, True
+    return c_success, c_total, t_success, t_total, False
 
 
 @overload
@@ -190,11 +234,18 @@ def _compute_z_score(
 ) -> float:
     """zスコアを計算する。"""
 
-    std_err_pool = np.sqrt(pooled_var)
-    continuity_adjustment = 0.5 * (1 / c_total + 1 / t_total) if correction else 0.0
-    sign_effect = 0.0 if effect == 0 else math.copysign(1.0, effect)
-    adjusted_effect = effect - sign_effect * continuity_adjustment if correction else effect
-    return float(adjusted_effect / std_err_pool)
+    std_err_pool = math.sqrt(pooled_var)
+    if not correction:
+        return effect / std_err_pool
+
+    # copysign + クランプで符号分岐なしに連続性修正を適用する。
+    # |effect| < 修正幅のときは 0 で止め、符号が反転する過補正を防ぐ
+    # （copysign(0.0, 0.0) == 0.0 なので effect=0 の場合分けも不要）。
+    continuity_adjustment = 0.5 * (1 / c_total + 1 / t_total)
+    adjusted_effect = effect - math.copysign(
+        min(abs(effect), continuity_adjustment), effect
+    )
+    return adjusted_effect / std_err_pool
 
 
 def _run_ztest(
@@ -206,26 +257,31 @@ def _run_ztest(
     t_success, t_total = treatment
 
     # 補正前の入力がゼロ分散・不正な総数でないことを先に確認する
-    _validate_assumptions(
-        c_total, t_total, _compute_pooled_variance(c_success, c_total, t_success, t_total)
-    )
-    # 補正前に標準誤差=0（全0/全1など）を弾いておく
-    _ensure_nonzero_standard_error(
-        _compute_basic_stats(c_success, c_total, t_success, t_total)[1]
-    )
-
-    c_success, c_total, t_success, t_total = _apply_agresti_caffo_correction(
-        c_success, c_total, t_success, t_total
-    )
-
     pooled_var = _compute_pooled_variance(c_success, c_total, t_success, t_total)
     _validate_assumptions(c_total, t_total, pooled_var)
-
+    # 補正前に標準誤差=0（全0/全1など）を弾いておく
     effect, se_diff = _compute_basic_stats(c_success, c_total, t_success, t_total)
     _ensure_nonzero_standard_error(se_diff)
 
-    z_score = _compute_z_score(effect, pooled_var, c_total, t_total, correction)
-    p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
+    c_success, c_total, t_success, t_total, adjusted = _apply_agresti_caffo_correction(
+        c_success, c_total, t_success, t_total
+    )
+    if adjusted:
+        # 大標本（補正なし）の典型ケースでは補正前の統計量をそのまま再利用する
+        pooled_var = _compute_pooled_variance(c_success, c_total, t_success, t_total)
+        _validate_assumptions(c_total, t_total, pooled_var)
+        effect, se_diff = _compute_basic_stats(c_success, c_total, t_success, t_total)
+        _ensure_nonzero_standard_error(se_diff)
+
+    if c_success * t_total == t_success * c_total:
+        # 両群の比率が厳密に等しい（ドライラン・無トラフィック等）場合は
+        # z=0, p=1 が自明に決まるため special 関数の呼び出しを省く
+        p_value = 1.0
+    else:
+        z_score = _compute_z_score(effect, pooled_var, c_total, t_total, correction)
+        # 対数 CDF 経由なら |z| が大きくても裾の確率が 1e-300 程度まで下位を保てる
+        # （1 - cdf(|z|) 形式は |z|>8 あたりで 0 に潰れ、結果の順位付けができなくなる）
+        p_value = 2 * math.exp(float(log_ndtr(-abs(z_score))))
     ci_low, ci_high = _compute_confidence_interval(effect, se_diff)
 
     return float(effect), float(p_value), float(ci_low), float(ci_high)
@@ -265,4 +321,83 @@ def ztest_proportions(
     return _run_ztest(control_pair, treatment_pair, correction)
 
 
-__all__ = ["ztest_proportions"]
+def ztest_proportions_batch(
+    control_successes: Iterable[int] | np.ndarray,
+    control_totals: Iterable[int] | np.ndarray,
+    treatment_successes: Iterable[int] | np.ndarray,
+    treatment_totals: Iterable[int] | np.ndarray,
+    *,
+    correction: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """K 本の二項比率 z 検定を一括実行する。
+
+    メトリクス×バリアントのダッシュボードのように多数のペアを評価する場合、
+    ztest_proportions を Python ループで回す代わりに配列演算と
+    1 回の ndtr 呼び出しで K 本をまとめて計算する。
+    Agresti-Caffo 補正の適用判定も np.where によるマスクで行ごとに行う。
+
+    Returns:
+        (effects, p_values, ci_lows, ci_highs) — いずれも形状 (K,) の配列
+    """
+
+    c_succ = np.asarray(control_successes, dtype=float)
+    c_tot = np.asarray(control_totals, dtype=float)
+    t_succ = np.asarray(treatment_successes, dtype=float)
+    t_tot = np.asarray(treatment_totals, dtype=float)
+    if not (c_succ.shape == c_tot.shape == t_succ.shape == t_tot.shape) or c_succ.ndim != 1:
+        raise ValueError("各群の成功数・総数は同じ長さの 1 次元配列にしてください")
+    if np.any(c_tot <= 0) or np.any(t_tot <= 0):
+        raise ValueError("総数は正の値である必要があります")
+    if (
+        np.any(c_succ < 0)
+        or np.any(t_succ < 0)
+        or np.any(c_succ > c_tot)
+        or np.any(t_succ > t_tot)
+    ):
+        raise ValueError("成功数は 0 以上 総数 以下で指定してください")
+
+    # 補正前の入力がゼロ分散・SE=0 でないことを先に確認する（スカラー版と同順）
+    pooled_raw = (c_succ + t_succ) / (c_tot + t_tot)
+    if np.any(pooled_raw * (1 - pooled_raw) <= 0):
+        raise ValueError("プールした分散が 0 です。入力データを確認してください")
+    rate_c_raw = c_succ / c_tot
+    rate_t_raw = t_succ / t_tot
+    se_raw = rate_c_raw * (1 - rate_c_raw) / c_tot + rate_t_raw * (1 - rate_t_raw) / t_tot
+    if np.any(se_raw == 0):
+        raise ValueError("標準誤差が 0 です。入力にばらつきがありません")
+
+    # Agresti-Caffo 補正（小標本の行にだけ成功1・失敗1を加算）
+    min_cells = np.minimum.reduce([c_succ, t_succ, c_tot - c_succ, t_tot - t_succ])
+    small = (np.minimum(c_tot, t_tot) < 30) | (min_cells < 5)
+    c_succ = np.where(small, c_succ + 1, c_succ)
+    c_tot = np.where(small, c_tot + 2, c_tot)
+    t_succ = np.where(small, t_succ + 1, t_succ)
+    t_tot = np.where(small, t_tot + 2, t_tot)
+
+    pooled = (c_succ + t_succ) / (c_tot + t_tot)
+    pooled_var = pooled * (1 - pooled) * (1 / c_tot + 1 / t_tot)
+
+    control_rate = c_succ / c_tot
+    treatment_rate = t_succ / t_tot
+    effect = treatment_rate - control_rate
+    se_diff = np.sqrt(
+        control_rate * (1 - control_rate) / c_tot
+        + treatment_rate * (1 - treatment_rate) / t_tot
+    )
+    if np.any(se_diff == 0):
+        raise ValueError("標準誤差が 0 です。入力にばらつきがありません")
+
+    adjusted = effect
+    if correction:
+        # スカラー版 _compute_z_score と同じく補正量を |effect| でクランプし、
+        # 符号が反転する過補正を防ぐ
+        continuity = 0.5 * (1 / c_tot + 1 / t_tot)
+        adjusted = effect - np.copysign(np.minimum(np.abs(effect), continuity), effect)
+    z_score = adjusted / np.sqrt(pooled_var)
+    # スカラー版と同じく対数 CDF 経由で極端な z でも裾の精度を保つ
+    p_value = 2 * np.exp(log_ndtr(-np.abs(z_score)))
+    margin = _Z_CRIT_975 * se_diff
+    return effect, p_value, effect - margin, effect + margin
+
+
+__all__ = ["ztest_proportions", "ztest_proportions_batch"]
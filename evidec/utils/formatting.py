@@ -5,7 +5,7 @@ report/decision など複数ドメインから参照される軽量関数を配
 
 from __future__ import annotations
 
-__all__ = ["_fmt_p", "_fmt_numeric", "_fmt_ci"]
+__all__ = ["_fmt_p", "_fmt_numeric", "_fmt_percent", "_fmt_decimal", "_fmt_ci"]
 
 
 def _fmt_p(p_value: float) -> str:
@@ -14,6 +14,20 @@ def _fmt_p(p_value: float) -> str:
     return "<0.0001" if p_value < 0.0001 else f"{p_value:.4f}"
 
 
+def _fmt_percent(value: float, force_sign: bool = True) -> str:
+    """数値をパーセント表記でフォーマットする。
+
+    フォーマット指定をリテラルに固定した特殊化版。
+    列単位で表記が決まっているバッチ整形ではこちらを直接使う。
+    """
+    return f"{value:+.1%}" if force_sign else f"{value:.1%}"
+
+
+def _fmt_decimal(value: float, force_sign: bool = True) -> str:
+    """数値を小数点表記でフォーマットする（_fmt_percent と対の特殊化版）。"""
+    return f"{value:+.3f}" if force_sign else f"{value:.3f}"
+
+
 def _fmt_numeric(value: float, as_percent: bool, force_sign: bool = True) -> str:
     """数値をパーセントまたは小数点表記でフォーマットする。
 
@@ -22,13 +36,13 @@ def _fmt_numeric(value: float, as_percent: bool, force_sign: bool = True) -> str
         as_percent: パーセント表記にするかどうか
         force_sign: 正の数に+をつけるかどうか (デフォルト: True)
     """
-    sign_str = "+" if force_sign else ""
     if as_percent:
-        return f"{value:{sign_str}.1%}"
-    return f"{value:{sign_str}.3f}"
+        return _fmt_percent(value, force_sign)
+    return _fmt_decimal(value, force_sign)
 
 
 def _fmt_ci(ci_low: float, ci_high: float, as_percent: bool) -> str:
     """信頼区間をフォーマットする。"""
 
-    return f"[{_fmt_numeric(ci_low, as_percent)}, {_fmt_numeric(ci_high, as_percent)}]"
+    fmt = _fmt_percent if as_percent else _fmt_decimal
+    return f"[{fmt(ci_low)}, {fmt(ci_high)}]"
@@ -0,0 +1,65 @@
+"""アーキテクチャテスト共有の fixture。
+
+各テストクラスが個別に evidec/ を走査・パースするのを避け、
+ファイル一覧・import マップ・依存グラフをセッションで 1 回だけ構築する。
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.arch.helpers import build_dependency_graph, get_evidec_imports, iter_py_files
+
+# pytest キャッシュ (.pytest_cache) 上の依存グラフ永続化キー
+_DEP_GRAPH_CACHE_KEY = "arch/dep_graph"
+
+
+def _tree_fingerprint(files: list[Path]) -> dict[str, list[int]]:
+    """ファイルごとの (mtime_ns, サイズ) 指紋。キャッシュ無効化の判定に使う。"""
+    fingerprint: dict[str, list[int]] = {}
+    for path in files:
+        stat = os.stat(path)
+        fingerprint[str(path)] = [stat.st_mtime_ns, stat.st_size]
+    return fingerprint
+
+
+@pytest.fixture(scope="session")
+def evidec_py_files() -> list[Path]:
+    """evidec 配下の Python ファイル一覧（1 回の走査を全テストで共有）。"""
+    return sorted(iter_py_files("evidec"))
+
+
+@pytest.fixture(scope="session")
+def evidec_imports_by_path(evidec_py_files: list[Path]) -> dict[Path, frozenset[str]]:
+    """ファイルごとの evidec.* import のマップ。"""
+    return {path: get_evidec_imports(path) for path in evidec_py_files}
+
+
+@pytest.fixture(scope="session")
+def evidec_dep_graph(
+    request: pytest.FixtureRequest, evidec_py_files: list[Path]
+) -> dict[str, set[str]]:
+    """evidec 内部モジュールの依存グラフ。
+
+    構築結果を pytest キャッシュに指紋付きで永続化し、
+    ソースが変わっていない再実行ではパースを丸ごとスキップする。
+    """
+    cache = request.config.cache
+    fingerprint = _tree_fingerprint(evidec_py_files)
+
+    cached = cache.get(_DEP_GRAPH_CACHE_KEY, None)
+    if cached is not None and cached.get("fingerprint") == fingerprint:
+        return {module: set(deps) for module, deps in cached["graph"].items()}
+
+    graph = build_dependency_graph(Path("evidec"))
+    cache.set(
+        _DEP_GRAPH_CACHE_KEY,
+        {
+            "fingerprint": fingerprint,
+            "graph": {module: sorted(deps) for module, deps in graph.items()},
+        },
+    )
+    return graph
@@ -3,12 +3,24 @@
 from __future__ import annotations
 
 import ast
-from collections.abc import Iterable
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 __all__ = [
+    "ModuleInfo",
+    "analyze_module",
+    "extract_module_metadata",
     "get_evidec_imports",
     "get_dunder_all",
+    "iter_py_files",
+    "module_name_from_path",
+    "get_internal_deps",
+    "build_dependency_graph",
 ]
 
 
@@ -27,7 +39,13 @@ def _is_type_checking_guard(node: ast.AST) -> bool:
 
 
 def _iter_import_nodes(root: ast.AST) -> Iterable[ast.AST]:
-    """TYPE_CHECKING ガード内を無視しつつ import ノードを列挙。"""
+    """TYPE_CHECKING ガード内を無視しつつ import ノードを列挙。
+
+    import は文としてしか現れないため、式ノード（演算・呼び出し・リテラル等）
+    には降りず、文の body/orelse/finalbody/handlers/cases だけを辿る
+    （cases は match 文の match_case で、その body に文が続く）。
+    全ノード走査に比べ訪問数が桁違いに減る。
+    """
     stack = [root]
     while stack:
         node = stack.pop()
@@ -35,33 +53,180 @@ def _iter_import_nodes(root: ast.AST) -> Iterable[ast.AST]:
             continue
         if isinstance(node, (ast.Import, ast.ImportFrom)):
             yield node
-        stack.extend(ast.iter_child_nodes(node))
+            continue
+        for field in ("body", "orelse", "finalbody", "handlers", "cases"):
+            children = getattr(node, field, None)
+            if children:
+                stack.extend(children)
 
 
-def get_evidec_imports(file_path: Path) -> set[str]:
-    """evidec.* への import を抽出する（相対 import は無視）。"""
-    tree = ast.parse(file_path.read_text(encoding="utf-8"), filename=str(file_path))
-    imports: set[str] = set()
+@cache
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> ast.Module:
+    """(パス, mtime, サイズ) をキーにパース結果をキャッシュする。
+
+    mtime とサイズをキーに含めることで、watch モードのような
+    長寿命セッションでもファイル更新時に自動で再パースされる。
+    """
+    # type comment の収集は不要なので明示的に無効化しておく
+    return ast.parse(
+        Path(path_str).read_text(encoding="utf-8"),
+        filename=path_str,
+        mode="exec",
+        type_comments=False,
+    )
+
+
+def _parse_file(path_str: str) -> ast.Module:
+    """ファイルのパース結果をキャッシュ経由で取得する。
+
+    アーキテクチャテストは同じファイルに対して import 抽出・__all__ 取得・
+    依存グラフ構築を別々に呼ぶため、キャッシュがないと読み込みと
+    パースがテストクラスの数だけ走る。
+    """
+    stat = os.stat(path_str)
+    return _parse_cached(path_str, stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass(frozen=True, slots=True)
+class ModuleInfo:
+    """1 モジュール分のアーキテクチャ検証用メタデータ。"""
+
+    evidec_imports: frozenset[str]
+    dunder_all: tuple[str, ...]
+    internal_deps: frozenset[str]
 
+
+def module_name_from_path(path: Path) -> str:
+    """ファイルパスから evidec のモジュール名を組み立てる。"""
+    rel = path.relative_to(Path("evidec"))
+    parts = list(rel.with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    # グラフのキー・依存集合・ドメイン表で同じ文字列が多数共有されるため intern する
+    return sys.intern(".".join(["evidec", *parts])) if parts else "evidec"
+
+
+def analyze_module(file_path: Path) -> ModuleInfo:
+    """evidec.* import・__all__・内部依存を 1 回の走査でまとめて抽出する。"""
+    stat = os.stat(file_path)
+    return _analyze_module_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@cache
+def _analyze_module_cached(path_str: str, mtime_ns: int, size: int) -> ModuleInfo:
+    """メタデータ抽出の本体（パース同様に mtime/サイズで無効化される）。
+
+    各テストが必要とする情報を個別の走査で集めると同じツリーを
+    3 回辿ることになるため、1 パスで全部を収集してキャッシュする。
+    """
+    tree = _parse_cached(path_str, mtime_ns, size)
+    path = Path(path_str)
+    # 相対 import の解決には自モジュール名が要る（evidec 外のファイルでは未使用）
+    try:
+        base_parts = module_name_from_path(path).split(".")
+    except ValueError:
+        base_parts = []
+
+    imports: set[str] = set()
+    deps: set[str] = set()
     for node in _iter_import_nodes(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
                 if alias.name.startswith("evidec"):
-                    imports.add(alias.name)
+                    imports.add(sys.intern(alias.name))
+                if alias.name.startswith("evidec."):
+                    deps.add(sys.intern(alias.name))
         elif isinstance(node, ast.ImportFrom):
-            if node.level != 0:
-                continue  # 相対 import はここでは扱わない
-            if node.module and node.module.startswith("evidec"):
-                imports.add(node.module)
-    return imports
+            if node.level == 0:
+                if node.module and node.module.startswith("evidec"):
+                    imports.add(sys.intern(node.module))
+                    if node.module.startswith("evidec."):
+                        deps.add(sys.intern(node.module))
+                continue
 
+            # 相対 import は evidec_imports には含めず、依存グラフでのみ解決する
+            if len(base_parts) < node.level:
+                continue
+            prefix = base_parts[: -node.level]
 
-def get_dunder_all(file_path: Path) -> list[str]:
-    """__all__ に定義されたシンボルを取得する。"""
-    tree = ast.parse(file_path.read_text(encoding="utf-8"), filename=str(file_path))
+            if node.module:
+                target = ".".join([*prefix, node.module])
+                if target.startswith("evidec."):
+                    deps.add(sys.intern(target))
+            else:  # from . import foo, bar
+                for alias in node.names:
+                    target = ".".join([*prefix, alias.name])
+                    if target.startswith("evidec."):
+                        deps.add(sys.intern(target))
+
+    dunder_all: tuple[str, ...] = ()
     for node in tree.body:
         if isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == "__all__":
-                    return ast.literal_eval(node.value)
-    return []
+            for target_node in node.targets:
+                if isinstance(target_node, ast.Name) and target_node.id == "__all__":
+                    dunder_all = tuple(ast.literal_eval(node.value))
+                    break
+
+    return ModuleInfo(
+        evidec_imports=frozenset(imports),
+        dunder_all=dunder_all,
+        internal_deps=frozenset(deps),
+    )
+
+
+def extract_module_metadata(file_path: Path) -> tuple[set[str], list[str]]:
+    """evidec.* import と __all__ を 1 パスで返す。"""
+    info = analyze_module(file_path)
+    return set(info.evidec_imports), list(info.dunder_all)
+
+
+def get_evidec_imports(file_path: Path) -> frozenset[str]:
+    """evidec.* への import を抽出する（相対 import は無視）。
+
+    analyze_module がキャッシュ済みの frozenset をそのまま返すため、
+    呼び出しごとの set コピーは発生しない。
+    """
+    return analyze_module(file_path).evidec_imports
+
+
+def get_dunder_all(file_path: Path) -> list[str]:
+    """__all__ に定義されたシンボルを取得する。"""
+    return list(analyze_module(file_path).dunder_all)
+
+
+def get_internal_deps(path: Path, module_name: str) -> set[str]:
+    """evidec 内部モジュールへの依存（相対 import 解決込み）を抽出する。"""
+    del module_name  # 解決は analyze_module 内でパスから行う
+    return set(analyze_module(path).internal_deps)
+
+
+def iter_py_files(root: str | Path) -> Iterator[Path]:
+    """os.scandir ベースで .py ファイルを再帰列挙する。
+
+    Path.rglob はエントリごとに PosixPath 生成と stat を伴うが、
+    scandir はディレクトリ読み出し自体から名前と種別が得られるため
+    syscall と割り当てが少ない。__pycache__ は読み飛ばす。
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name.endswith(".py"):
+                    yield Path(entry.path)
+
+
+def build_dependency_graph(root: Path) -> dict[str, set[str]]:
+    """evidec 配下の全モジュールの内部依存グラフを構築する。
+
+    読み込みと ast.parse は C レベルで GIL を手放す区間が大きいため、
+    ファイルごとの抽出をスレッドプールで重ねる。キャッシュ済みの
+    ファイルはプールを経由してもそのままヒットする。
+    """
+    paths = list(iter_py_files(root))
+    names = [module_name_from_path(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        deps = executor.map(get_internal_deps, paths, names)
+    return dict(zip(names, deps, strict=True))
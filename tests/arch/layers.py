@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 # ドメイン間の許可依存マトリクス
@@ -22,6 +23,12 @@ ALLOWED_DOMAIN_DEPS: dict[str, set[str]] = {
     "utils": set(),
 }
 
+# (依存元, 依存先) の許可エッジ集合。import ごとに許可集合を組み立て直す
+# 代わりに、1 回のタプル検索で判定できるよう事前展開しておく。
+ALLOWED_DOMAIN_EDGES: frozenset[tuple[str, str]] = frozenset(
+    (domain, dep) for domain, deps in ALLOWED_DOMAIN_DEPS.items() for dep in deps
+)
+
 
 def domain_of_path(path: Path) -> str:
     """ファイルパスからドメイン名を推定する。"""
@@ -43,4 +50,5 @@ def domain_of_module(module: str) -> str:
     parts = module.split(".")
     if len(parts) < 2:
         return "root"
-    return parts[1]
+    # 許可マトリクスのキーと同一オブジェクトを共有できるよう intern して返す
+    return sys.intern(parts[1])
@@ -4,22 +4,22 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from tests.arch.helpers import get_evidec_imports
-from tests.arch.layers import ALLOWED_DOMAIN_DEPS, domain_of_module, domain_of_path
+from tests.arch.layers import ALLOWED_DOMAIN_EDGES, domain_of_module, domain_of_path
 
 
 class TestLayeredDependencies:
-    def test_許可された依存方向のみ(self) -> None:
-        root = Path("evidec")
+    def test_許可された依存方向のみ(
+        self, evidec_imports_by_path: dict[Path, frozenset[str]]
+    ) -> None:
         violations: list[tuple[str, str, str]] = []  # (file, domain, imported)
 
-        for path in root.rglob("*.py"):
+        for path, imports in evidec_imports_by_path.items():
             domain = domain_of_path(path)
-            allowed = ALLOWED_DOMAIN_DEPS.get(domain, {domain}) | {domain}
 
-            for imp in get_evidec_imports(path):
+            for imp in imports:
                 dep_domain = domain_of_module(imp)
-                if dep_domain not in allowed:
+                # 同一ドメイン内は常に許可。他ドメインは許可エッジのみ。
+                if dep_domain != domain and (domain, dep_domain) not in ALLOWED_DOMAIN_EDGES:
                     violations.append((str(path), domain, imp))
 
         assert not violations, (
@@ -0,0 +1,248 @@
+import numpy as np
+import pytest
+
+from evidec.stats import (
+    BayesResult,
+    BetaBinomialSession,
+    fit_beta_binomial,
+    fit_beta_binomial_batch,
+    fit_beta_binomial_from_arrays,
+    fit_beta_binomial_from_prior,
+)
+
+
+def test_整数事後分布では解析解が使われる():
+    # Arrange
+    control = (30, 200)
+    treatment = (50, 210)
+
+    # Act
+    result = fit_beta_binomial(control, treatment)
+
+    # Assert
+    assert result.method == "analytic"
+    # lift の事後平均は Beta 事後の平均の差（厳密値）
+    expected_lift = 51 / 212 - 31 / 202
+    assert result.lift_mean == pytest.approx(expected_lift, rel=1e-12)
+    assert 0.9 < result.p_improve < 1.0
+    assert result.ci_low < result.lift_mean < result.ci_high
+
+
+def test_解析解とサンプリングが近い値を返す():
+    # Arrange
+    control = (30, 200)
+    treatment = (50, 210)
+
+    # Act
+    analytic = fit_beta_binomial(control, treatment, method="analytic")
+    # 許容誤差 abs=0.01 に対して MC 標準誤差 ~1/√4000 ≈ 0.008 で足りる
+    sampled = fit_beta_binomial(control, treatment, method="sampling", seed=0, n_draws=4000)
+
+    # Assert
+    assert sampled.method == "sampling"
+    assert sampled.p_improve == pytest.approx(analytic.p_improve, abs=0.01)
+    assert sampled.lift_mean == pytest.approx(analytic.lift_mean, abs=0.01)
+    assert sampled.ci_low == pytest.approx(analytic.ci_low, abs=0.01)
+    assert sampled.ci_high == pytest.approx(analytic.ci_high, abs=0.01)
+
+
+def test_toleranceゼロではp_above_tolがp_improveと一致する():
+    # Arrange & Act
+    result = fit_beta_binomial((30, 200), (50, 210), tolerance=0.0)
+
+    # Assert
+    assert result.p_above_tol == result.p_improve
+
+
+def test_負のtoleranceでp_above_tolが大きくなる():
+    # Arrange & Act
+    result = fit_beta_binomial((30, 200), (50, 210), tolerance=-0.01)
+
+    # Assert
+    assert result.p_above_tol > result.p_improve
+
+
+def test_非整数の事前分布ではサンプリングにフォールバックする():
+    # Arrange & Act
+    # method の分岐だけを見るテストなのでドロー数は最小限でよい
+    result = fit_beta_binomial(
+        (30, 200), (50, 210), alpha0=0.5, beta0=0.5, seed=0, n_draws=500
+    )
+
+    # Assert
+    assert result.method == "sampling"
+
+
+def test_歪んだ事前分布でもサンプリング結果が妥当な範囲に収まる():
+    # Arrange: α0 < 1 の歪んだ事前分布は 2 本の Gamma ドロー経路を通る
+    analytic = fit_beta_binomial((30, 200), (50, 210), method="analytic")
+
+    # Act
+    sampled = fit_beta_binomial(
+        (30, 200), (50, 210), alpha0=0.5, beta0=0.5, method="sampling", seed=0, n_draws=4000
+    )
+
+    # Assert
+    assert sampled.p_improve == pytest.approx(analytic.p_improve, abs=0.02)
+    assert sampled.lift_mean == pytest.approx(analytic.lift_mean, abs=0.01)
+
+
+def test_同一データならp_improveはほぼ半分():
+    # Arrange & Act
+    result = fit_beta_binomial((50, 100), (50, 100))
+
+    # Assert
+    assert result.p_improve == pytest.approx(0.5, abs=1e-6)
+    assert result.lift_mean == pytest.approx(0.0, abs=1e-12)
+
+
+def test_配列入力でも同じ結果になる():
+    # Arrange
+    control_arr = np.concatenate([np.ones(30), np.zeros(170)])
+    treatment_arr = np.concatenate([np.ones(50), np.zeros(160)])
+
+    # Act
+    from_arrays = fit_beta_binomial_from_arrays(control_arr, treatment_arr)
+    from_counts = fit_beta_binomial((30, 200), (50, 210))
+
+    # Assert
+    assert from_arrays == from_counts
+
+
+def test_bool配列と整数配列でも同じ結果になる():
+    # Arrange
+    base = np.concatenate([np.ones(30), np.zeros(170)])
+    treat = np.concatenate([np.ones(50), np.zeros(160)])
+
+    # Act
+    from_float = fit_beta_binomial_from_arrays(base, treat)
+    from_bool = fit_beta_binomial_from_arrays(base.astype(bool), treat.astype(bool))
+    from_int = fit_beta_binomial_from_arrays(base.astype(int), treat.astype(int))
+
+    # Assert
+    assert from_bool == from_float
+    assert from_int == from_float
+
+
+def test_事前平均と強度から事前分布を構成できる():
+    # Arrange & Act
+    result = fit_beta_binomial_from_prior(
+        (30, 200), (50, 210), prior_mean=0.2, prior_strength=10
+    )
+
+    # Assert
+    assert result.params.alpha0 == pytest.approx(2.0)
+    assert result.params.beta0 == pytest.approx(8.0)
+
+
+def test_float32サンプリングでも結果が近い():
+    # Arrange
+    analytic = fit_beta_binomial((30, 200), (50, 210), method="analytic")
+
+    # Act
+    result = fit_beta_binomial(
+        (30, 200), (50, 210), method="sampling", seed=0, dtype=np.float32, n_draws=4000
+    )
+
+    # Assert: モンテカルロ標準誤差 (~1/√4000) は float32 精度より粗い
+    assert result.p_improve == pytest.approx(analytic.p_improve, abs=0.02)
+    assert result.lift_mean == pytest.approx(analytic.lift_mean, abs=0.01)
+    assert result.ci_low == pytest.approx(analytic.ci_low, abs=0.01)
+    assert result.ci_high == pytest.approx(analytic.ci_high, abs=0.01)
+
+
+def test_セッション再利用でもサンプリング結果が妥当():
+    # Arrange
+    session = BetaBinomialSession(seed=0, n_draws=4000)
+    analytic = fit_beta_binomial((30, 200), (50, 210), method="analytic")
+
+    # Act: 同一セッションで 2 回呼び、バッファ再利用後も値が壊れないこと
+    first = fit_beta_binomial((30, 200), (50, 210), method="sampling", session=session)
+    second = fit_beta_binomial((30, 200), (50, 210), method="sampling", session=session)
+
+    # Assert
+    for result in (first, second):
+        assert result.p_improve == pytest.approx(analytic.p_improve, abs=0.02)
+        assert result.lift_mean == pytest.approx(analytic.lift_mean, abs=0.01)
+    assert first.params.n_draws == session.n_draws
+
+
+def test_バッチ評価が個別の解析解と近い値を返す():
+    # Arrange
+    pairs = [((30, 200), (50, 210)), ((40, 300), (45, 310)), ((10, 100), (25, 100))]
+    c_succ = [c[0] for c, _ in pairs]
+    c_tot = [c[1] for c, _ in pairs]
+    t_succ = [t[0] for _, t in pairs]
+    t_tot = [t[1] for _, t in pairs]
+
+    # Act
+    batch = fit_beta_binomial_batch(c_succ, c_tot, t_succ, t_tot, seed=0, n_draws=4000)
+
+    # Assert
+    assert len(batch) == len(pairs)
+    for result, (control, treatment) in zip(batch, pairs, strict=True):
+        analytic = fit_beta_binomial(control, treatment, method="analytic")
+        assert result.method == "sampling"
+        assert result.p_improve == pytest.approx(analytic.p_improve, abs=0.02)
+        assert result.lift_mean == pytest.approx(analytic.lift_mean, abs=0.01)
+        assert result.ci_low == pytest.approx(analytic.ci_low, abs=0.01)
+        assert result.ci_high == pytest.approx(analytic.ci_high, abs=0.01)
+
+
+def test_to_arraysが列指向の配列を返す():
+    # Arrange
+    batch = fit_beta_binomial_batch(
+        [30, 40], [200, 300], [50, 45], [210, 310], seed=0, n_draws=500
+    )
+
+    # Act
+    columns = BayesResult.to_arrays(batch)
+
+    # Assert
+    assert set(columns) == {"p_improve", "p_above_tol", "lift_mean", "ci_low", "ci_high"}
+    np.testing.assert_allclose(columns["p_improve"], [r.p_improve for r in batch])
+    np.testing.assert_allclose(columns["lift_mean"], [r.lift_mean for r in batch])
+
+
+def test_バッチ評価は群の長さ不一致で例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="同じ実験数"):
+        fit_beta_binomial_batch([30, 40], [200, 300], [50], [210])
+
+
+def test_セッションのn_drawsが不正なら例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="n_draws"):
+        BetaBinomialSession(n_draws=0)
+
+
+@pytest.mark.parametrize(
+    "control, treatment",
+    [
+        ((30, 0), (50, 210)),  # 総数が0
+        ((-1, 200), (50, 210)),  # 成功数が負
+        ((201, 200), (50, 210)),  # 成功数 > 総数
+    ],
+)
+def test_不正なカウントは例外を投げる(control, treatment):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        fit_beta_binomial(control, treatment)
+
+
+def test_不正な事前分布は例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="事前分布"):
+        fit_beta_binomial((30, 200), (50, 210), alpha0=0.0)
+
+
+def test_不正なmethodは例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="method"):
+        fit_beta_binomial((30, 200), (50, 210), method="exact")
+
+
+def test_0と1以外を含む配列は例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="0/1"):
+        fit_beta_binomial_from_arrays([0, 1, 2], [0, 1, 1])
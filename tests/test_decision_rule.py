@@ -1,9 +1,14 @@
+from functools import cache
+
 import pytest
 
 from evidec.core import DecisionRule, StatResult
 from evidec.utils.formatting import _fmt_numeric, _fmt_p
 
 
+# StatResult は frozen で judge も純粋なため、同じ (effect, p, baseline) の
+# 組をテスト間で共有できる
+@cache
 def make_result(effect: float, p_value: float, baseline: float = 0.2) -> StatResult:
     return StatResult(
         effect=effect,
@@ -127,3 +132,42 @@ def test_describe_thresholdで閾値文字列を返す():
     # Assert
     assert "最小リフト" in criterion
     assert threshold.endswith("%")
+
+
+def test_judge_statusはjudgeのstatusと一致する():
+    # Arrange
+    rule = DecisionRule(alpha=0.05, min_lift=0.01, metric_goal="increase", min_effect_size=0.005)
+    results = [
+        make_result(0.02, 0.01),  # GO
+        make_result(0.02, 0.2),  # INCONCLUSIVE (p > α)
+        make_result(-0.03, 0.01),  # NO_GO (方向が逆)
+        make_result(0.005, 0.001),  # INCONCLUSIVE (リフト不足)
+        make_result(0.001, 0.001),  # INCONCLUSIVE (効果量不足)
+    ]
+
+    # Act & Assert
+    for result in results:
+        assert rule.judge_status(result) == rule.judge(result).status
+
+
+def test_judge_batchはjudge_statusのループと一致する():
+    # Arrange
+    rule = DecisionRule(alpha=0.05, min_lift=0.01, metric_goal="increase", min_effect_size=0.005)
+    effects = [0.02, 0.02, -0.03, 0.005, 0.001]
+    p_values = [0.01, 0.2, 0.01, 0.001, 0.001]
+
+    # Act
+    batch = rule.judge_batch(effects, p_values)
+
+    # Assert
+    expected = [
+        rule.judge_status(make_result(effect, p))
+        for effect, p in zip(effects, p_values, strict=True)
+    ]
+    assert batch == expected
+
+
+def test_judge_batchは長さ不一致で例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="同じ長さ"):
+        DecisionRule().judge_batch([0.01, 0.02], [0.05])
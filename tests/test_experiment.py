@@ -7,8 +7,9 @@ from evidec.core import Experiment
 def test_比率データを検出してz検定を選ぶ():
     # Arrange
     exp = Experiment(name="ctr_test", metric="ctr", variant_names=("control", "treatment"))
-    control = np.array([0, 1, 0, 1, 0, 0, 1, 0, 0, 1] * 5)
-    treatment = np.array([1, 1, 1, 0, 1, 1, 0, 1, 1, 1] * 5)
+    # Python リストの 5 倍展開を経由せず、基本パターンの繰り返しを C 側で行う
+    control = np.tile(np.array([0, 1, 0, 1, 0, 0, 1, 0, 0, 1], dtype=np.int8), 5)
+    treatment = np.tile(np.array([1, 1, 1, 0, 1, 1, 0, 1, 1, 1], dtype=np.int8), 5)
 
     # Act
     result = exp.fit(control, treatment)
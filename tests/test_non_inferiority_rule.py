@@ -124,3 +124,17 @@ def test_describe_threshold_減少目標では上限表記になる() -> None:
     # Assert
     assert "許容悪化幅(上限)" in criterion
     assert threshold == "+2.0%"
+
+
+def test_judge_statusはjudgeのstatusと一致する() -> None:
+    # Arrange
+    rule = NonInferiorityRule(alpha=0.05, margin=0.01, metric_goal="increase")
+    results = [
+        _make_result(effect=0.0, ci_low=-0.005, ci_high=0.005),  # GO
+        _make_result(effect=-0.03, ci_low=-0.04, ci_high=-0.02),  # NO_GO
+        _make_result(effect=-0.01, ci_low=-0.02, ci_high=0.0),  # INCONCLUSIVE
+    ]
+
+    # Act & Assert
+    for result in results:
+        assert rule.judge_status(result) == rule.judge(result).status
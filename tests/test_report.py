@@ -1,19 +1,35 @@
 import numpy as np
+import pytest
 
 from evidec.core import DecisionRule, EvidenceReport, Experiment
 
+# ctr_report シナリオの 0/1 ベクトル。毎回 concatenate で組み立てる代わりに
+# モジュールで 1 回だけ構築し、読み取り専用にして共有する。
+_CONTROL_70_30 = np.repeat(np.array([0.0, 1.0]), [70, 30])
+_CONTROL_70_30.setflags(write=False)
+_TREATMENT_60_40 = np.repeat(np.array([0.0, 1.0]), [60, 40])
+_TREATMENT_60_40.setflags(write=False)
 
-def test_レポートに主要セクションが含まれる():
-    # Arrange
+
+@pytest.fixture(scope="module")
+def ctr_report_pipeline():
+    """ctr_report シナリオの fit→judge→レポート生成をモジュールで 1 回だけ実行する。
+
+    同じ入力で複数テストがセクション構成を検証するため、
+    パイプラインの結果を共有して z 検定と描画の再実行を避ける。
+    """
     exp = Experiment(name="ctr_report", metric="ctr", variant_names=("control", "treatment"))
-    control = np.concatenate([np.zeros(70), np.ones(30)])
-    treatment = np.concatenate([np.zeros(60), np.ones(40)])
     rule = DecisionRule(alpha=0.05, min_lift=0.01, metric_goal="increase")
 
-    # Act
-    result = exp.fit(control, treatment)
+    result = exp.fit(_CONTROL_70_30, _TREATMENT_60_40)
     decision = rule.judge(result)
     report = EvidenceReport.from_result(exp, rule, decision, result)
+    return exp, decision, report
+
+
+def test_レポートに主要セクションが含まれる(ctr_report_pipeline):
+    # Arrange
+    exp, decision, report = ctr_report_pipeline
 
     # Assert
     assert "## 主要結果" in report.markdown
@@ -21,17 +37,9 @@ def test_レポートに主要セクションが含まれる():
     assert report.summary.startswith(exp.name)
 
 
-def test_簡易セクション構成でも必要項目を含む():
+def test_簡易セクション構成でも必要項目を含む(ctr_report_pipeline):
     # Arrange
-    exp = Experiment(name="ctr_report", metric="ctr", variant_names=("control", "treatment"))
-    control = np.concatenate([np.zeros(70), np.ones(30)])
-    treatment = np.concatenate([np.zeros(60), np.ones(40)])
-    rule = DecisionRule(alpha=0.05, min_lift=0.01, metric_goal="increase")
-
-    # Act
-    result = exp.fit(control, treatment)
-    decision = rule.judge(result)
-    report = EvidenceReport.from_result(exp, rule, decision, result)
+    _, _, report = ctr_report_pipeline
 
     # Assert
     assert "## 結論" in report.markdown
@@ -1,7 +1,13 @@
 import numpy as np
 import pytest
 
-from evidec.stats import ttest_means, ztest_proportions
+from evidec.stats import (
+    ttest_means,
+    ttest_means_batch,
+    ttest_means_from_stats,
+    ztest_proportions,
+    ztest_proportions_batch,
+)
 
 
 def test_z検定が期待値を返す():
@@ -99,3 +105,115 @@ def test_t検定は無限大を含むと例外を投げる():
     # Act & Assert
     with pytest.raises(ValueError, match="NaN と無限大を除去した後も"):
         ttest_means(control, treatment)
+
+
+def test_十分統計量からのt検定が配列版と一致する():
+    # Arrange
+    control = np.array([10.1, 9.8, 10.4, 9.9, 10.0])
+    treatment = np.array([10.8, 10.5, 10.6, 10.7, 10.9])
+
+    # Act
+    from_arrays = ttest_means(control, treatment)
+    from_stats = ttest_means_from_stats(
+        control.size,
+        float(control.mean()),
+        float(control.var(ddof=1)),
+        treatment.size,
+        float(treatment.mean()),
+        float(treatment.var(ddof=1)),
+    )
+
+    # Assert
+    assert from_stats == pytest.approx(from_arrays, rel=1e-12)
+
+
+def test_十分統計量からのt検定は最小サンプル未満で例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="2 件以上"):
+        ttest_means_from_stats(1, 1.0, 0.0, 3, 2.0, 1.0)
+
+
+def test_バッチt検定が個別のt検定と一致する():
+    # Arrange: 2 行目の末尾 NaN は可変長サンプルのパディング
+    control = np.array(
+        [
+            [10.1, 9.8, 10.4, 9.9, 10.0],
+            [5.0, 5.5, 4.8, 5.2, np.nan],
+        ]
+    )
+    treatment = np.array(
+        [
+            [10.8, 10.5, 10.6, 10.7, 10.9],
+            [5.9, 6.1, 5.8, 6.0, 6.2],
+        ]
+    )
+
+    # Act
+    effects, p_values, ci_lows, ci_highs = ttest_means_batch(control, treatment)
+
+    # Assert
+    for i in range(2):
+        row_c = control[i][np.isfinite(control[i])]
+        effect, p_value, ci_low, ci_high = ttest_means(row_c, treatment[i])
+        assert effects[i] == pytest.approx(effect, rel=1e-12)
+        assert p_values[i] == pytest.approx(p_value, rel=1e-12)
+        assert ci_lows[i] == pytest.approx(ci_low, rel=1e-12)
+        assert ci_highs[i] == pytest.approx(ci_high, rel=1e-12)
+
+
+def test_バッチt検定は行数不一致で例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="同じ行数"):
+        ttest_means_batch(np.zeros((2, 5)), np.zeros((3, 5)))
+
+
+def test_バッチz検定が個別のz検定と一致する():
+    # Arrange: 小標本（Agresti-Caffo 補正対象）を 2 行目に混ぜる
+    c_succ = [30, 3]
+    c_tot = [200, 20]
+    t_succ = [50, 8]
+    t_tot = [210, 22]
+
+    # Act
+    effects, p_values, ci_lows, ci_highs = ztest_proportions_batch(c_succ, c_tot, t_succ, t_tot)
+
+    # Assert
+    for i in range(2):
+        effect, p_value, ci_low, ci_high = ztest_proportions(
+            (c_succ[i], c_tot[i]), treatment_success=(t_succ[i], t_tot[i])
+        )
+        assert effects[i] == pytest.approx(effect, rel=1e-12)
+        assert p_values[i] == pytest.approx(p_value, rel=1e-12)
+        assert ci_lows[i] == pytest.approx(ci_low, rel=1e-12)
+        assert ci_highs[i] == pytest.approx(ci_high, rel=1e-12)
+
+
+def test_バッチz検定は連続性修正でも個別のz検定と一致する():
+    # Arrange: 2 行目は |effect| が修正幅より小さく、クランプが効くケース
+    c_succ = [30, 5]
+    c_tot = [200, 10]
+    t_succ = [50, 5]
+    t_tot = [210, 11]
+
+    # Act
+    effects, p_values, ci_lows, ci_highs = ztest_proportions_batch(
+        c_succ, c_tot, t_succ, t_tot, correction=True
+    )
+
+    # Assert
+    for i in range(2):
+        effect, p_value, ci_low, ci_high = ztest_proportions(
+            (c_succ[i], c_tot[i]),
+            treatment_success=(t_succ[i], t_tot[i]),
+            correction=True,
+        )
+        assert effects[i] == pytest.approx(effect, rel=1e-12)
+        assert p_values[i] == pytest.approx(p_value, rel=1e-12)
+        assert ci_lows[i] == pytest.approx(ci_low, rel=1e-12)
+        assert ci_highs[i] == pytest.approx(ci_high, rel=1e-12)
+
+
+def test_バッチz検定は長さ不一致で例外を投げる():
+    # Act & Assert
+    with pytest.raises(ValueError, match="同じ長さ"):
+        ztest_proportions_batch([30], [200, 300], [50], [210])